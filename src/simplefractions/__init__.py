@@ -35,12 +35,16 @@ the simplest fraction that converts to the given float.
 
 import decimal
 import fractions
+import functools
 import math
 import numbers
-import struct
 import typing
 
-from simplefractions._simplest_in_interval import _simplest_in_interval
+from simplefractions._simplest_in_interval import (
+    _fraction_from_coprime_ints,
+    _simplest_in_interval,
+    _simplest_in_interval_pos,
+)
 
 #: Names to be exported when doing 'from simplefractions import *'.
 __all__ = ["simplest_from_float", "simplest_in_interval"]
@@ -50,6 +54,28 @@ __all__ = ["simplest_from_float", "simplest_in_interval"]
 #: constructor"
 FractionCompatible = typing.Union[int, float, decimal.Decimal, numbers.Rational]
 
+#: Precision of an IEEE 754 binary64 float, in bits.
+_MANT_DIG = 53
+
+#: Smallest integer significand of a normal float.
+_MIN_SIGNIFICAND = 2 ** (_MANT_DIG - 1)
+
+#: Smallest positive normal float.
+_MIN_NORMAL = 2.0**-1022
+
+#: Exponent of the smallest positive subnormal float, 2**-1074.
+_MIN_EXP = -1074
+
+#: Bound on abs(n) * d below which the float n / d is its own simplest
+#: fraction; see simplest_from_float.
+_FAST_PATH_BOUND = 2 ** (_MANT_DIG - 1)
+
+#: Largest integer-valued float that is its own simplest fraction.
+_MAX_EXACT_INT = 2**_MANT_DIG
+
+#: Maximum number of results held in the _simplest_from_float_cached cache.
+_SIMPLEST_FROM_FLOAT_CACHE_SIZE = 4096
+
 
 def simplest_in_interval(
     left: typing.Optional[FractionCompatible] = None,
@@ -91,61 +117,122 @@ def simplest_in_interval(
     ValueError
         If the interval is empty.
     """
-    # Backwards compatibility
-    if left == -math.inf:
+    # Backwards compatibility: -math.inf and math.inf are accepted in place
+    # of None. Integers and Fractions can't be infinite, so skip the (for
+    # Fractions, relatively expensive) comparison for those.
+    if not isinstance(left, (int, fractions.Fraction)) and left == -math.inf:
         left = None
-    if right == math.inf:
+    if not isinstance(right, (int, fractions.Fraction)) and right == math.inf:
         right = None
 
-    # Convert floats, Decimal instances, integers, etc. to the
-    # corresponding Fraction.
-    if left is not None:
-        left = fractions.Fraction(left)
-    if right is not None:
-        right = fractions.Fraction(right)
-
     return _simplest_in_interval(
-        left, right, include_left=include_left, include_right=include_right
+        None if left is None else _to_integer_ratio(left),
+        None if right is None else _to_integer_ratio(right),
+        include_left=include_left,
+        include_right=include_right,
     )
 
 
-def _interval_rounding_to(
-    x: float,
-) -> typing.Tuple[fractions.Fraction, fractions.Fraction, bool]:
+def _to_integer_ratio(x: FractionCompatible) -> typing.Tuple[int, int]:
+    """
+    Express a finite number as a ratio of integers.
+
+    Returns
+    -------
+    numerator, denominator : int
+        Numerator and denominator of x, in lowest terms, with positive
+        denominator.
+    """
+    # Handle the common types directly, to avoid creating a Fraction.
+    if isinstance(x, int):
+        return x, 1
+    if isinstance(x, fractions.Fraction):
+        return x.numerator, x.denominator
+    if isinstance(x, (float, decimal.Decimal)):
+        return x.as_integer_ratio()
+
+    fraction = fractions.Fraction(x)
+    return fraction.numerator, fraction.denominator
+
+
+def _dyadic_ratio(n: int, e: int) -> typing.Tuple[int, int]:
+    """
+    Return n * 2**e as a numerator-denominator pair.
+
+    Parameters
+    ----------
+    n, e : int
+        Integers representing the value n * 2**e.
+
+    Returns
+    -------
+    num, den : int
+        Numerator and denominator of n * 2**e. If n is odd, or if e is
+        nonnegative, the fraction is in lowest terms.
+    """
+    return (n << e, 1) if e >= 0 else (n, 1 << -e)
+
+
+def _interval_rounding_to(x: float) -> typing.Tuple[int, int, int, int, bool]:
     """
-    Return the interval of numbers that round to a given float.
+    Return the interval of numbers that round to a given nonnegative float.
+
+    Parameters
+    ----------
+    x : float
+        A finite, nonnegative float.
 
     Returns
     -------
-    left, right : fractions.Fraction
-        Endpoints of the interval of all numbers that round to x
-        under the standard round-ties-to-even rounding mode.
+    left_num, left_den : int
+        Numerator and denominator of the left endpoint of the interval of all
+        numbers that round to x under the standard round-ties-to-even
+        rounding mode, in lowest terms.
+    right_num, right_den : int
+        Numerator and denominator of the right endpoint of the interval, in
+        lowest terms.
     closed : bool
         True if the interval is closed at both ends, else False.
     """
-    if x < 0:
-        left, right, closed = _interval_rounding_to(-x)
-        return -right, -left, closed
-
-    if x == 0:
-        n = struct.unpack("<Q", struct.pack("<d", 0.0))[0]
-        x_plus = struct.unpack("<d", struct.pack("<Q", n + 1))[0]
-        right = (fractions.Fraction(x) + fractions.Fraction(x_plus)) / 2
-        return -right, right, True
-
-    n = struct.unpack("<Q", struct.pack("<d", x))[0]
-    x_plus = struct.unpack("<d", struct.pack("<Q", n + 1))[0]
-    x_minus = struct.unpack("<d", struct.pack("<Q", n - 1))[0]
-
-    closed = n % 2 == 0
-    left = (fractions.Fraction(x) + fractions.Fraction(x_minus)) / 2
-    if math.isinf(x_plus):
-        # Corner case where x was the largest representable finite float
-        right = 2 * fractions.Fraction(x) - left
+    # Write x as m * 2**e, where 2**e is the gap between x and the next
+    # float up (so m is the integer significand of x). Zero and subnormals
+    # share the fixed exponent of the smallest subnormal.
+    if x < _MIN_NORMAL:
+        e = _MIN_EXP
     else:
-        right = (fractions.Fraction(x) + fractions.Fraction(x_plus)) / 2
+        e = math.frexp(x)[1] - _MANT_DIG
+    m = int(math.ldexp(x, -e))
+
+    # The neighbours of x are at distance 2**e, except when x is an exact
+    # power of two, where the gap to the next float down is halved. Round-ties-
+    # to-even means the endpoints belong to the interval iff m is even.
+    if m == _MIN_SIGNIFICAND and e > _MIN_EXP:
+        left_num, left_den = _dyadic_ratio(4 * m - 1, e - 2)
+    else:
+        left_num, left_den = _dyadic_ratio(2 * m - 1, e - 1)
+    right_num, right_den = _dyadic_ratio(2 * m + 1, e - 1)
+    closed = (m & 1) == 0
+    return left_num, left_den, right_num, right_den, closed
 
-    return left, right, closed
+
+@functools.lru_cache(maxsize=_SIMPLEST_FROM_FLOAT_CACHE_SIZE)
+def _simplest_from_float_cached(x: float) -> fractions.Fraction:
+    """
+    Return the simplest fraction that converts to the given finite float.
+
+    x must be nonzero. Results are cached, keyed by x. The result depends
+    only on the value of x, so repeated calls with commonly occurring floats
+    cost a single cache lookup.
+    """
+    # The interval rounding to a nonzero float is nonempty and lies strictly
+    # on one side of zero, so we can go straight to the core algorithm on
+    # the interval for abs(x), skipping the checks and sign dispatch done by
+    # _simplest_in_interval.
+    left_num, left_den, right_num, right_den, closed = _interval_rounding_to(abs(x))
+    n, d = _simplest_in_interval_pos(
+        left_num, left_den, closed, right_num, right_den, closed
+    )
+    return _fraction_from_coprime_ints(-n if x < 0 else n, d)
 
 
 def simplest_from_float(x: float) -> fractions.Fraction:
@@ -172,5 +259,25 @@ def simplest_from_float(x: float) -> fractions.Fraction:
     if not math.isfinite(x):
         raise ValueError("x should be finite")
 
-    left, right, closed = _interval_rounding_to(x)
-    return _simplest_in_interval(left, right, include_left=closed, include_right=closed)
+    # Accept ints and other real numbers, as the type hint allows. This also
+    # ensures that as_integer_ratio is available on Python < 3.8, and that
+    # the cache below sees only floats.
+    x = float(x)
+
+    # Fast path for floats like 0.75 or 12.0 that are exactly equal to a
+    # fraction n / d with small n and d. Two distinct fractions with
+    # denominators at most d differ by at least 1 / d**2, while for normal
+    # (or zero) x the interval of values rounding to x has length at most
+    # abs(x) / 2**52. So if abs(n) * d < 2**52, then n / d is the only
+    # fraction in that interval with denominator at most d, and hence is
+    # the simplest.
+    #
+    # That covers integers smaller than 2**52 in absolute value. Integers
+    # up to 2**53 are also their own simplest fraction: values rounding to
+    # such an x are within 1/2 of x on the side nearer zero, so no integer
+    # closer to zero rounds to x. Beyond 2**53 that's no longer true.
+    n, d = x.as_integer_ratio()
+    if abs(n) * d < _FAST_PATH_BOUND or d == 1 and abs(n) <= _MAX_EXACT_INT:
+        return _fraction_from_coprime_ints(n, d)
+
+    return _simplest_from_float_cached(x)
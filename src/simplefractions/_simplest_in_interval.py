@@ -137,18 +137,57 @@ def _simplest_in_interval_pos(
     x, y : int
         Numerator and denominator of the simplest fraction in the interval.
     """
+    # Rather than r and v, the loop keeps track of rt = r - t and vw = v - w.
+    # This folds the boolean flags into the integers that use them.
     a, b, c, d = 1, 0, 0, 1
+    rt, vw = r - t, v - w
     while True:
-        q = (r - t) // s
-        r, s, t, u, v, w = v, u - q * v, w, s, r - q * s, t
-        a, b, c, d = b + q * a, a, d + q * c, c
-        if r - t < s:
+        q, m = divmod(rt, s)
+        # This is the simultaneous update
+        #   r, s, t, u, v, w = v, u - q * v, w, s, r - q * s, t
+        #   a, b, c, d = b + q * a, a, d + q * c, c
+        # rewritten in terms of rt and vw, and split into pairs: CPython
+        # performs two-element swaps without building an intermediate tuple.
+        # Note that the new vw, rt - q * s, is just the remainder m.
+        rt, vw = vw, m
+        s, u = u - q * (rt + w), s
+        t, w = w, t
+        a, b = b + q * a, a
+        c, d = d + q * c, c
+        if rt < s:
             return a + b, c + d
 
 
+def _fraction_from_coprime_ints(numerator: int, denominator: int) -> fractions.Fraction:
+    """
+    Create a Fraction from a numerator and denominator in lowest terms.
+
+    This skips the gcd computation done by the Fraction constructor, which
+    can be significant for large numerators and denominators.
+
+    Parameters
+    ----------
+    numerator : int
+        Numerator of the fraction.
+    denominator : int
+        Denominator of the fraction. Must be positive and relatively prime
+        to the numerator.
+
+    Returns
+    -------
+    fractions.Fraction
+        The fraction numerator / denominator.
+    """
+    # This is what Fraction._from_coprime_ints does on Python >= 3.12.
+    fraction = object.__new__(fractions.Fraction)
+    fraction._numerator = numerator  # type: ignore[attr-defined]
+    fraction._denominator = denominator  # type: ignore[attr-defined]
+    return fraction
+
+
 def _simplest_in_interval(
-    left: typing.Optional[fractions.Fraction] = None,
-    right: typing.Optional[fractions.Fraction] = None,
+    left: typing.Optional[typing.Tuple[int, int]] = None,
+    right: typing.Optional[typing.Tuple[int, int]] = None,
     *,
     include_left: bool = False,
     include_right: bool = False,
@@ -158,12 +197,14 @@ def _simplest_in_interval(
 
     Parameters
     ----------
-    left : fractions.Fraction, optional
-        Left endpoint of the interval. If not given, the left
-        endpoint is -infinity.
-    right : fractions.Fraction, optional
-        Right endpoint of the interval. If not given, the right
-        end point is infinity.
+    left : tuple of int, optional
+        Numerator and denominator of the left endpoint of the interval. The
+        denominator must be positive. If not given, the left endpoint is
+        -infinity.
+    right : tuple of int, optional
+        Numerator and denominator of the right endpoint of the interval. The
+        denominator must be positive. If not given, the right end point
+        is infinity.
     include_left : bool, optional
         True if the left endpoint should be included in the interval.
         The default is False. Must be False if the left endpoint is -infinity.
@@ -192,22 +233,33 @@ def _simplest_in_interval(
     if left is None:
         r, s, t = (-1, 0, False)
     else:
-        r, s, t = (left.numerator, left.denominator, include_left)
+        (r, s), t = left, include_left
     if right is None:
         u, v, w = (1, 0, False)
     else:
-        u, v, w = (right.numerator, right.denominator, include_right)
-
-    # Raise on an empty interval.
-    if s and v and u * s + t * w <= r * v:
-        raise ValueError("empty interval")
-
+        (u, v), w = right, include_right
+
+    # Raise on an empty interval. An interval whose endpoints are equal is
+    # either empty or (if closed) contains only that endpoint.
+    if s and v:
+        rv, us = r * v, u * s
+        if us <= rv:
+            if us < rv or not (t and w):
+                raise ValueError("empty interval")
+            return fractions.Fraction(r, s)
+
+    # The numerator and denominator returned by _simplest_in_interval_pos are
+    # a + b and c + d, where a * d - b * c = ±1 (see the proof above). Hence
+    # (a + b) * d - (c + d) * b = ±1, so they're relatively prime and we can
+    # skip the gcd when creating the Fraction.
     if u + w <= 0:
         # Subinterval of negative real line.
-        return -fractions.Fraction(*_simplest_in_interval_pos(-u, v, w, -r, s, t))
+        x, y = _simplest_in_interval_pos(-u, v, w, -r, s, t)
+        return _fraction_from_coprime_ints(-x, y)
     elif r - t < 0:
         # Interval contains zero.
         return fractions.Fraction(0, 1)
     else:
         # Subinterval of positive real line.
-        return fractions.Fraction(*_simplest_in_interval_pos(r, s, t, u, v, w))
+        x, y = _simplest_in_interval_pos(r, s, t, u, v, w)
+        return _fraction_from_coprime_ints(x, y)
@@ -12,27 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import decimal
 import fractions
 import math
 import random
 import sys
 import unittest
 
-from simplefractions import simplest_from_float, simplest_in_interval
+from simplefractions import (
+    _simplest_from_float_cached,
+    simplest_from_float,
+    simplest_in_interval,
+)
+
+#: Positive fractions with numerator and denominator smaller than 100.
+SMALL_FRACTIONS = tuple(
+    fractions.Fraction(n, d)
+    for n in range(1, 100)
+    for d in range(1, 100)
+    if math.gcd(n, d) == 1
+)
 
 
 class SimpleFractionsTests(unittest.TestCase):
     def test_simplest_in_closed_interval(self) -> None:
         # Round fractions to nearest 1000, see if we can recover them
-
-        test_fractions = [
-            fractions.Fraction(n, d)
-            for n in range(1, 100)
-            for d in range(1, 100)
-            if math.gcd(n, d) == 1
-        ]
-
-        for c in test_fractions:
+        for c in SMALL_FRACTIONS:
             z = fractions.Fraction(round(c * 1000), 1000)
             x = z - fractions.Fraction(1, 2000)
             y = z + fractions.Fraction(1, 2000)
@@ -63,6 +68,17 @@ class SimpleFractionsTests(unittest.TestCase):
             simplest_in_interval(0, 0, include_left=True, include_right=True),
             0,
         )
+        self.assertEqual(
+            simplest_in_interval(
+                F(-7, 3), F(-14, 6), include_left=True, include_right=True
+            ),
+            F(-7, 3),
+        )
+        big = F(10**50 + 1, 10**50)
+        self.assertEqual(
+            simplest_in_interval(big, big, include_left=True, include_right=True),
+            big,
+        )
 
     def test_simplest_in_open_interval(self) -> None:
         F = fractions.Fraction
@@ -212,13 +228,48 @@ class SimpleFractionsTests(unittest.TestCase):
             0,
         )
 
+        # Decimal endpoints, including infinities in place of None.
+        D = decimal.Decimal
+        self.assertEqual(
+            simplest_in_interval(D("0.31"), D("0.35")),
+            fractions.Fraction(1, 3),
+        )
+        self.assertEqual(
+            simplest_in_interval(D("-0.35"), D("-0.31"), include_right=True),
+            fractions.Fraction(-1, 3),
+        )
+        self.assertEqual(simplest_in_interval(D("2.5"), D("Infinity")), 3)
+        self.assertEqual(simplest_in_interval(D("-Infinity"), D("-2.5")), -3)
+        self.assertEqual(simplest_in_interval(D("-Infinity"), D("Infinity")), 0)
+
+        # NaN endpoints are rejected.
+        with self.assertRaises(ValueError):
+            simplest_in_interval(D("NaN"), 1)
+        with self.assertRaises(ValueError):
+            simplest_in_interval(0, D("NaN"))
+        with self.assertRaises(ValueError):
+            simplest_in_interval(math.nan, 1)
+
     def test_simplest_from_float_roundtrip(self) -> None:
-        test_values = [0.0, 0.3, -0.3, 1e-100, sys.float_info.max]
+        test_values = [
+            0.0,
+            0.3,
+            -0.3,
+            1e-100,
+            sys.float_info.max,
+            -sys.float_info.max,
+            5e-324,
+            sys.float_info.min,
+            -2.0,
+            2.0**60,
+        ]
 
         for value in test_values:
             with self.subTest(value=value):
                 self.assertEqual(float(simplest_from_float(value)), value)
 
+        self.assertEqual(simplest_from_float(0.1), fractions.Fraction(1, 10))
+
     def test_simplest_from_float(self) -> None:
         # Given a fraction n/d (n and d positive),
         # simplest_from_float(n/d) should give another fraction
@@ -244,6 +295,37 @@ class SimpleFractionsTests(unittest.TestCase):
             with self.subTest(f=f):
                 self.check_simplest_from_float(f)
 
+    def test_simplest_from_float_exact_small_fractions(self) -> None:
+        # Floats exactly equal to a fraction with small numerator and
+        # power-of-two denominator recover that fraction.
+        for n in range(-100, 100):
+            for d in [1, 2, 4, 8, 16, 1024]:
+                f = fractions.Fraction(n, d)
+                with self.subTest(f=f):
+                    self.assertEqual(simplest_from_float(n / d), f)
+
+        # Integer-valued floats: the fraction is recovered exactly as long as
+        # no smaller integer rounds to the same float.
+        self.assertEqual(simplest_from_float(2.0**51), 2**51)
+        self.assertEqual(simplest_from_float(2.0**52 + 1.0), 2**52 + 1)
+        self.assertEqual(simplest_from_float(2.0**53), 2**53)
+        self.assertEqual(simplest_from_float(2.0**60), 2**60 - 2**6)
+        self.assertEqual(simplest_from_float(-(2.0**60)), -(2**60) + 2**6)
+
+        # Integers are accepted in place of the corresponding floats.
+        self.assertEqual(simplest_from_float(3), 3)
+        self.assertEqual(simplest_from_float(-3), -3)
+        self.assertEqual(simplest_from_float(2**60), 2**60 - 2**6)
+
+    def test_simplest_from_float_cached(self) -> None:
+        # Values not handled by the fast path are cached.
+        value = 0.1
+        expected = fractions.Fraction(1, 10)
+        self.assertEqual(simplest_from_float(value), expected)
+        hits = _simplest_from_float_cached.cache_info().hits
+        self.assertEqual(simplest_from_float(value), expected)
+        self.assertEqual(_simplest_from_float_cached.cache_info().hits, hits + 1)
+
     def test_simplest_from_float_special_values(self) -> None:
         with self.assertRaises(ValueError):
             simplest_from_float(math.inf)
@@ -252,6 +334,30 @@ class SimpleFractionsTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             simplest_from_float(math.nan)
 
+        # Negative zero gives a zero fraction.
+        self.assertEqual(simplest_from_float(-0.0), 0)
+
+    def test_results_in_lowest_terms(self) -> None:
+        # Results are built without normalization, relying on the algorithm
+        # to produce a coprime numerator and denominator. Check that.
+        F = fractions.Fraction
+        results = [
+            simplest_from_float(value)
+            for value in [0.1, -0.1, 1e-100, -1e100, math.pi, 5e-324]
+        ]
+        results.extend(
+            simplest_in_interval(F(n, 1000), F(n + 1, 1000)) for n in range(-50, 50)
+        )
+        results.extend(simplest_in_interval(F(n, 1000), None) for n in range(-50, 50))
+        results.extend(simplest_in_interval(None, F(n, 1000)) for n in range(-50, 50))
+        for result in results:
+            with self.subTest(result=result):
+                self.assertGreater(result.denominator, 0)
+                self.assertEqual(math.gcd(result.numerator, result.denominator), 1)
+                self.assertEqual(
+                    result, F(result.numerator * 3, result.denominator * 3)
+                )
+
     def test_simplest_in_interval_defaults(self) -> None:
         # By default, assumes an open interval.
         self.assertEqual(simplest_in_interval(3, 5), 4)
@@ -271,6 +377,10 @@ class SimpleFractionsTests(unittest.TestCase):
             simplest_in_interval(None, 2, include_left=True)
         with self.assertRaises(ValueError):
             simplest_in_interval(2, None, include_right=True)
+        with self.assertRaises(ValueError):
+            simplest_in_interval(decimal.Decimal("-Infinity"), 2, include_left=True)
+        with self.assertRaises(ValueError):
+            simplest_in_interval(2, decimal.Decimal("Infinity"), include_right=True)
 
     def check_simplest_from_float(self, f: fractions.Fraction) -> None:
         """